@@ -0,0 +1,273 @@
+"""
+AI Pathfinder - compiled search kernels
+
+Each kernel runs a complete search over a precomputed neighbor table and
+records every expansion in a trace buffer, which the GUI then replays to
+animate the search. Cells are flat indices (row * GRID_COLS + col),
+nbr[idx, k] is the cell reached by direction k, or -1 off the grid, and
+walls[idx] is 1 for a blocked cell. The search-local visited arrays start as
+copies of walls, so one test skips both walls and cells already seen.
+
+Kernels are compiled with nogil=True, so a search running on the worker
+thread does not hold up the UI loop. Numba is optional: without it the
+kernels run as plain Python.
+"""
+
+import heapq
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+# ─── Trace events: trace[i] = (kind, value) ───────────────────────────────────
+EV_EXPLORE  = 0   # value: cell popped and expanded
+EV_FRONTIER = 1   # value: cell pushed onto the frontier
+EV_DEPTH    = 2   # value: new IDDFS depth limit (search state restarts)
+
+
+def trace_capacity(n_cells):
+    """Trace rows needed for any kernel: IDDFS's worst case of n_cells - 1
+    depth-limited passes, each emitting at most 2 * n_cells + 1 events."""
+    return n_cells * (2 * n_cells + 1)
+
+
+@njit(cache=True, nogil=True)
+def _emit(trace, n, kind, value):
+    trace[n, 0] = kind
+    trace[n, 1] = value
+    return n + 1
+
+
+@njit(cache=True, nogil=True)
+def walk_parents(parent, idx):
+    """Cells from the search root down to idx, following parent links."""
+    length, cur = 0, idx
+    while cur != -1:
+        length += 1
+        cur = parent[cur]
+    path = np.empty(length, np.int32)
+    cur = idx
+    for i in range(length - 1, -1, -1):
+        path[i] = cur
+        cur = parent[cur]
+    return path
+
+
+@njit(cache=True, nogil=True)
+def bfs(nbr, walls, start, target, parent, trace):
+    """Breadth-first search. Returns (n_events, target or -1)."""
+    n_cells = nbr.shape[0]
+    queue   = np.empty(n_cells, np.int32)   # every cell is queued at most once
+    visited = walls.copy()
+    queue[0] = start
+    visited[start] = 1
+    head, tail, n = 0, 1, 0
+
+    while head < tail:
+        idx = queue[head]
+        head += 1
+        n = _emit(trace, n, EV_EXPLORE, idx)
+        if idx == target:
+            return n, target
+
+        for k in range(nbr.shape[1]):
+            nb = nbr[idx, k]
+            if nb >= 0 and not visited[nb]:
+                visited[nb] = 1
+                parent[nb] = idx
+                queue[tail] = nb
+                tail += 1
+                n = _emit(trace, n, EV_FRONTIER, nb)
+                if nb == target:
+                    return n, target    # first push is already the shortest
+    return n, -1
+
+
+@njit(cache=True, nogil=True)
+def dfs(nbr, walls, start, target, parent, trace):
+    """Depth-first search. Returns (n_events, target or -1)."""
+    n_cells = nbr.shape[0]
+    stack   = np.empty(n_cells, np.int32)
+    visited = walls.copy()
+    stack[0] = start
+    visited[start] = 1
+    top, n = 1, 0
+
+    while top > 0:
+        top -= 1
+        idx = stack[top]
+        n = _emit(trace, n, EV_EXPLORE, idx)
+        if idx == target:
+            return n, target
+
+        # Push in reverse so the first direction is popped first
+        for k in range(nbr.shape[1] - 1, -1, -1):
+            nb = nbr[idx, k]
+            if nb >= 0 and not visited[nb]:
+                visited[nb] = 1
+                parent[nb] = idx
+                stack[top] = nb
+                top += 1
+                n = _emit(trace, n, EV_FRONTIER, nb)
+                if nb == target:
+                    return n, target
+    return n, -1
+
+
+@njit(cache=True, nogil=True)
+def ucs(nbr, walls, costs, start, target, parent, trace):
+    """Uniform-cost search; costs[k] is the step cost of direction k.
+    Returns (n_events, target or -1)."""
+    g = np.full(nbr.shape[0], np.inf)
+    g[start] = 0.0
+    # (cost, insertion counter, idx): the counter keeps ties in FIFO order
+    heap    = [(0.0, 0, start)]
+    counter = 1
+    n = 0
+
+    while len(heap) > 0:
+        cost, _, idx = heapq.heappop(heap)
+        if cost > g[idx]:
+            continue    # stale entry superseded by a cheaper push
+        n = _emit(trace, n, EV_EXPLORE, idx)
+        if idx == target:
+            return n, target
+
+        for k in range(nbr.shape[1]):
+            nb = nbr[idx, k]
+            if nb < 0 or walls[nb]:
+                continue
+            new_cost = cost + costs[k]
+            if new_cost < g[nb]:
+                g[nb] = new_cost
+                parent[nb] = idx
+                heapq.heappush(heap, (new_cost, counter, np.int64(nb)))
+                counter += 1
+                n = _emit(trace, n, EV_FRONTIER, nb)
+    return n, -1
+
+
+@njit(cache=True, nogil=True)
+def dls(nbr, walls, start, target, limit, parent, trace, n):
+    """Iterative depth-limited search appending to trace from row n.
+    Returns (n_events, target or -1, cutoff), where cutoff says whether the
+    depth limit stopped any cell from being expanded."""
+    n_cells = nbr.shape[0]
+    stack   = np.empty(n_cells, np.int32)
+    depth   = np.empty(n_cells, np.int32)
+    visited = walls.copy()
+    stack[0] = start
+    depth[0] = 0
+    visited[start] = 1
+    top = 1
+    cutoff = False
+
+    while top > 0:
+        top -= 1
+        idx, d = stack[top], depth[top]
+        n = _emit(trace, n, EV_EXPLORE, idx)
+        if idx == target:
+            return n, target, cutoff
+
+        if d < limit:
+            for k in range(nbr.shape[1] - 1, -1, -1):
+                nb = nbr[idx, k]
+                if nb >= 0 and not visited[nb]:
+                    visited[nb] = 1
+                    parent[nb] = idx
+                    stack[top] = nb
+                    depth[top] = d + 1
+                    top += 1
+                    n = _emit(trace, n, EV_FRONTIER, nb)
+                    if nb == target:
+                        return n, target, cutoff
+        elif not cutoff:
+            for k in range(nbr.shape[1]):
+                nb = nbr[idx, k]
+                if nb >= 0 and not visited[nb]:
+                    cutoff = True
+                    break
+    return n, -1, cutoff
+
+
+@njit(cache=True, nogil=True)
+def iddfs(nbr, walls, start, target, parent, trace):
+    """Iterative deepening: DLS with limits 1, 2, ... each preceded by an
+    EV_DEPTH event. Returns (n_events, target or -1)."""
+    n = 0
+    for limit in range(1, nbr.shape[0]):
+        parent[:] = -1
+        n = _emit(trace, n, EV_DEPTH, limit)
+        n, found, cutoff = dls(nbr, walls, start, target, limit, parent, trace, n)
+        if found >= 0:
+            return n, found
+        if not cutoff:
+            # The limit never got in the way, so the whole reachable area was
+            # searched; deeper passes would only repeat it
+            break
+    return n, -1
+
+
+@njit(cache=True, nogil=True)
+def _expand_side(nbr, queue, head, tail, own_seen, other_seen, own_dist,
+                 other_dist, parent, trace, n, best, meet):
+    """Pop and expand one cell of one half of a bidirectional search, keeping
+    the cheapest cell seen by both sides so far as (best, meet).
+    Returns (head, tail, n_events, best, meet)."""
+    idx = queue[head]
+    head += 1
+    n = _emit(trace, n, EV_EXPLORE, idx)
+    for k in range(nbr.shape[1]):
+        nb = nbr[idx, k]
+        if nb >= 0 and not own_seen[nb]:
+            own_seen[nb] = 1
+            own_dist[nb] = own_dist[idx] + 1
+            parent[nb] = idx
+            queue[tail] = nb
+            tail += 1
+            n = _emit(trace, n, EV_FRONTIER, nb)
+            if other_seen[nb] and own_dist[nb] + other_dist[nb] < best:
+                best, meet = own_dist[nb] + other_dist[nb], nb
+    return head, tail, n, best, meet
+
+
+@njit(cache=True, nogil=True)
+def bidirectional(nbr, walls, start, target, fwd_parent, bwd_parent, trace):
+    """BFS from start and target, always expanding the side with the smaller
+    frontier. Returns (n_events, meeting cell or -1); the path is fwd_parent
+    up to the meeting cell followed by bwd_parent back down to target."""
+    n_cells   = nbr.shape[0]
+    fwd_queue = np.empty(n_cells, np.int32)
+    bwd_queue = np.empty(n_cells, np.int32)
+    fwd_seen  = walls.copy()
+    bwd_seen  = walls.copy()
+    fwd_dist  = np.zeros(n_cells, np.int32)
+    bwd_dist  = np.zeros(n_cells, np.int32)
+    fwd_queue[0] = start
+    bwd_queue[0] = target
+    fwd_seen[start]  = 1
+    bwd_seen[target] = 1
+    fh, ft, bh, bt, n = 0, 1, 0, 1, 0
+    best, meet = (0, start) if start == target else (n_cells, -1)
+
+    # Any path shorter than best must still cross from an unexpanded forward
+    # cell to an unexpanded backward one, so it is at least as long as the
+    # two queue heads' distances plus one step. Once either side runs dry its
+    # whole component has been searched.
+    while fh < ft and bh < bt:
+        if fwd_dist[fwd_queue[fh]] + bwd_dist[bwd_queue[bh]] + 1 >= best:
+            break
+        if ft - fh <= bt - bh:
+            fh, ft, n, best, meet = _expand_side(
+                nbr, fwd_queue, fh, ft, fwd_seen, bwd_seen, fwd_dist, bwd_dist,
+                fwd_parent, trace, n, best, meet)
+        else:
+            bh, bt, n, best, meet = _expand_side(
+                nbr, bwd_queue, bh, bt, bwd_seen, fwd_seen, bwd_dist, fwd_dist,
+                bwd_parent, trace, n, best, meet)
+    return n, meet
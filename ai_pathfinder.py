@@ -4,14 +4,20 @@ Uninformed Search Visualization
 
 Algorithms: BFS, DFS, UCS, DLS, IDDFS, Bidirectional Search
 Movement: 6 Directions (Up, Right, Bottom, Bottom-Right, Left, Top-Left)
+
+The searches themselves run as compiled kernels (see _search_numba.py);
+this module replays their traces step by step.
 """
 
 import pygame
 import sys
 import time
 import math
-from collections import deque
-import heapq
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+import _search_numba as kernels
 
 pygame.init()
 
@@ -24,6 +30,8 @@ CELL_SIZE     = 22
 GRID_OFFSET_X = 30
 GRID_OFFSET_Y = 130
 PANEL_X       = GRID_OFFSET_X + GRID_COLS * CELL_SIZE + 30
+FPS           = 60
+IDLE_WAIT_MS  = 250   # longest the idle main loop sleeps without an event
 
 # ─── Colors ───────────────────────────────────────────────────────────────────
 C_BG          = (15,  23,  42)
@@ -41,6 +49,12 @@ C_BTN_HOVER   = (80,  100, 130)
 C_BTN_ACTIVE  = (34,  197, 94)
 C_ACCENT      = (99,  179, 237)
 C_SUBTEXT     = (148, 163, 184)
+C_KEY         = (255, 0,   255)   # transparent colorkey, used by no real color
+
+# Cell render states, in drawing precedence order, indexing PALETTE
+R_EMPTY, R_WALL, R_FRONTIER, R_EXPLORED, R_PATH, R_START, R_TARGET = range(7)
+PALETTE = np.array([C_EMPTY, C_WALL, C_FRONTIER, C_EXPLORED,
+                    C_PATH, C_START, C_TARGET], dtype=np.uint8)
 
 # ─── Strict Movement Order (6 directions only) ────────────────────────────────
 DIRECTIONS = [
@@ -51,79 +65,172 @@ DIRECTIONS = [
     ( 0, -1),  # 5. Left
     (-1, -1),  # 6. Top-Left (Main Diagonal)
 ]
+SQRT2 = math.sqrt(2)
+COSTS = tuple(SQRT2 if dr and dc else 1.0 for dr, dc in DIRECTIONS)
+_COST_ARR = np.array(COSTS)
+_NO_PATH  = np.empty(0, dtype=np.int32)
+
+N_CELLS = GRID_ROWS * GRID_COLS   # flat cell index = row * GRID_COLS + col
+
+def _grid_neighbors():
+    """Neighbor table for the search kernels: nbr[idx, k] is the cell reached
+    from idx by DIRECTIONS[k], or -1 off the grid. Walls are checked by the
+    kernels, so this is built once and never invalidated by edits."""
+    rows, cols = np.divmod(np.arange(N_CELLS), GRID_COLS)
+    nbr = np.full((N_CELLS, len(DIRECTIONS)), -1, dtype=np.int32)
+    for k, (dr, dc) in enumerate(DIRECTIONS):
+        nr, nc = rows + dr, cols + dc
+        ok = (nr >= 0) & (nr < GRID_ROWS) & (nc >= 0) & (nc < GRID_COLS)
+        nbr[ok, k] = (nr * GRID_COLS + nc)[ok]
+    return nbr
+
+_NBR = _grid_neighbors()
 
 ALGORITHMS = ["BFS", "DFS", "UCS", "DLS", "IDDFS", "Bidirectional"]
+STAT_LABELS = ["Nodes Explored", "Frontier Size", "Path Length", "Time"]
+LEGEND = [("Start (S)",  C_START), ("Target (T)", C_TARGET),
+          ("Wall",       C_WALL),  ("Frontier",   C_FRONTIER),
+          ("Explored",   C_EXPLORED), ("Path",    C_PATH)]
 DLS_DEPTH_LIMIT = 20
-
-
-# ─── Node ─────────────────────────────────────────────────────────────────────
-class Node:
-    def __init__(self, row, col, cost=0, parent=None):
-        self.row    = row
-        self.col    = col
-        self.cost   = cost
-        self.parent = parent
-
-    def __lt__(self, other): return self.cost < other.cost
-    def __eq__(self, other): return self.row == other.row and self.col == other.col
-    def __hash__(self):      return hash((self.row, self.col))
+PANEL_RECT = pygame.Rect(PANEL_X, GRID_OFFSET_Y,
+                         WINDOW_WIDTH - PANEL_X, WINDOW_HEIGHT - GRID_OFFSET_Y)
 
 
 # ─── Button ───────────────────────────────────────────────────────────────────
 class Button:
     def __init__(self, x, y, w, h, text, font_size=19):
         self.rect    = pygame.Rect(x, y, w, h)
-        self.text    = text
         self.font    = pygame.font.Font(None, font_size)
+        self.text    = text
         self.active  = False
         self.hovered = False
-
-    def draw(self, surf):
-        col = C_BTN_ACTIVE if self.active else (C_BTN_HOVER if self.hovered else C_BTN)
-        pygame.draw.rect(surf, col, self.rect, border_radius=7)
-        pygame.draw.rect(surf, C_TEXT, self.rect, 1, border_radius=7)
-        ts = self.font.render(self.text, True, C_TEXT)
-        surf.blit(ts, ts.get_rect(center=self.rect.center))
-
-    def handle(self, event):
-        if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
-        elif event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
-                return True
-        return False
+        self._faces  = {}   # (active, hovered, text) -> rendered button
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        # Render the label once per change rather than every frame
+        self._text = text
+        self._text_surf = self.font.render(text, True, C_TEXT)
+
+    @property
+    def look(self):
+        return self.active, self.hovered, self._text
+
+    def face(self, background):
+        """The button as it currently looks, drawn over its own patch of
+        background. Each distinct look is rendered once and then reused."""
+        surf = self._faces.get(self.look)
+        if surf is None:
+            surf = background.subsurface(self.rect).copy()
+            r = surf.get_rect()
+            col = C_BTN_ACTIVE if self.active else (C_BTN_HOVER if self.hovered else C_BTN)
+            pygame.draw.rect(surf, col, r, border_radius=7)
+            pygame.draw.rect(surf, C_TEXT, r, 1, border_radius=7)
+            surf.blit(self._text_surf, self._text_surf.get_rect(center=r.center))
+            self._faces[self.look] = surf
+        return surf
 
 
 # ─── Main App ─────────────────────────────────────────────────────────────────
 class PathfinderApp:
     def __init__(self):
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        # SCALED presents through an SDL renderer (GPU where available), and
+        # vsync lets the display cap the frame rate without tearing
+        size, flags = (WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF
+        try:
+            self.screen = pygame.display.set_mode(size, flags, vsync=1)
+        except pygame.error:
+            # Not every driver/renderer can do vsync
+            self.screen = pygame.display.set_mode(size, flags)
         pygame.display.set_caption("AI Pathfinder  –   ")
         self.clock  = pygame.time.Clock()
 
         self.font_title  = pygame.font.Font(None, 38)
         self.font_info   = pygame.font.Font(None, 23)
         self.font_small  = pygame.font.Font(None, 19)
+        self._prerender_text()
+
+        # Cached grid image, rebuilt only when a cell is flagged in _dirty
+        grid_px = (GRID_COLS * CELL_SIZE, GRID_ROWS * CELL_SIZE)
+        self._grid_surf = pygame.Surface(grid_px).convert()
+        self._dirty     = np.ones(N_CELLS, dtype=bool)
+        # One pixel per cell; scaled up to the grid image on rebuild
+        self._cell_surf = pygame.Surface((GRID_COLS, GRID_ROWS)).convert()
+        # Cell borders, drawn once and laid over the colors. The lines are
+        # opaque, so a colorkey (RLE-encoded) blits far faster than alpha.
+        self._gridlines = pygame.Surface(grid_px).convert()
+        self._gridlines.fill(C_KEY)
+        for r in range(GRID_ROWS):
+            for c in range(GRID_COLS):
+                pygame.draw.rect(self._gridlines, C_GRID,
+                                 (c * CELL_SIZE, r * CELL_SIZE, CELL_SIZE, CELL_SIZE), 1)
+        self._gridlines.set_colorkey(C_KEY, pygame.RLEACCEL)
+
+        # What is on screen, so _draw can skip anything unchanged
+        self._full_redraw = True
+        self._visible     = True   # False while minimized or hidden
+        self._btn_drawn   = {}
+        self._panel_drawn = None
 
         self._init_grid()
         self._build_buttons()
         self._reset_state()
+        self._trace = np.empty((kernels.trace_capacity(N_CELLS), 2), dtype=np.int32)
+        # One long-lived worker runs every search; no thread per Run click
+        self._pool   = ThreadPoolExecutor(max_workers=1)
+        self._search = None
+        self._build_background()
+        self._warm_up()
+
+    def _prerender_text(self):
+        """Render the panel's fixed text once; only values change per frame."""
+        self._hdr_stats  = self.font_info.render("Statistics", True, C_ACCENT)
+        self._hdr_legend = self.font_info.render("Legend", True, C_ACCENT)
+        self._lbl_algo   = self.font_info.render("Algorithm:  ", True, C_TEXT)
+        self._lbl_mode   = self.font_small.render("Edit Mode:  ", True, C_ACCENT)
+        self._text_cache = {}
+        self._stat_label_surfs = [self.font_small.render(f"{label}:  ", True, C_SUBTEXT)
+                                  for label in STAT_LABELS]
+        self._legend_surfs = [(self.font_small.render(label, True, C_TEXT), col)
+                              for label, col in LEGEND]
+        # Blitted on every grid rebuild, so keep them in the display's format
+        self._glyph_start  = self.font_small.render("S", True, C_TEXT).convert_alpha()
+        self._glyph_target = self.font_small.render("T", True, C_TEXT).convert_alpha()
+
+    def _text(self, font, text, color):
+        """Rendered text for the panel's values that come from a small set
+        (algorithm, status, edit mode), cached so each is rasterized once."""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self._text_cache[key] = font.render(text, True, color).convert_alpha()
+        return surf
 
     # ── Grid setup ──────────────────────────────────────────────────────────
     def _init_grid(self):
-        self.grid   = [[0]*GRID_COLS for _ in range(GRID_ROWS)]
-        self.start  = (1, 1)
-        self.target = (GRID_ROWS - 2, GRID_COLS - 2)
-        self.grid[self.start[0]][self.start[1]]   = 2
-        self.grid[self.target[0]][self.target[1]] = 3
+        self.grid   = np.zeros((GRID_ROWS, GRID_COLS), dtype=np.uint8)
+        # start / target are flat cell indices, like everything the kernels see
+        self.start  = 1 * GRID_COLS + 1
+        self.target = (GRID_ROWS - 2) * GRID_COLS + (GRID_COLS - 2)
+        self.grid.flat[self.start]  = 2
+        self.grid.flat[self.target] = 3
+        self._dirty[:] = True
 
     def _reset_state(self):
-        self.frontier  = set()
-        self.explored  = set()
+        self.frontier_mask = np.zeros(N_CELLS, dtype=np.uint8)
+        self.explored_mask = np.zeros(N_CELLS, dtype=np.uint8)
+        self.path_mask     = np.zeros(N_CELLS, dtype=np.uint8)
         self.path      = []
         self.algo_idx  = 0
         self.running   = False
-        self.paused    = False
+        self._resume   = threading.Event()   # set while not paused
+        self._resume.set()
+        self._paint_buffer = []    # flat cells dragged over this frame
+        self._paint_value  = 1     # what a drag writes: 1 = wall, 0 = empty
         self.step_delay = 40   # ms between steps
         self.stats = dict(nodes_explored=0, frontier_size=0,
                           path_length=0, elapsed=0.0, status="Ready")
@@ -166,481 +273,528 @@ class PathfinderApp:
         }
         self.edit_mode = 'place_wall'
         self.mode_btns['place_wall'].active = True
+        self._buttons = (*self.algo_btns, *self.ctrl_btns, *self.mode_btns.values())
+        # Parallel rect list for one C-level hit test per mouse event
+        self._btn_rects = [b.rect for b in self._buttons]
+        self._hovered   = None
+
+    # ── Button dispatch ─────────────────────────────────────────────────────
+    def _button_at(self, pos):
+        i = pygame.Rect(pos, (1, 1)).collidelist(self._btn_rects)
+        return self._buttons[i] if i >= 0 else None
+
+    def _hover(self, b):
+        if b is not self._hovered:
+            if self._hovered is not None:
+                self._hovered.hovered = False
+            if b is not None:
+                b.hovered = True
+            self._hovered = b
+
+    def _press(self, b):
+        if b in self.algo_btns:
+            # The replay draws into the masks it started with; switching
+            # (and clearing) mid-search would leave it drawing off-screen
+            if self._searching():
+                return
+            for ob in self.algo_btns: ob.active = False
+            b.active = True
+            self.algo_idx = self.algo_btns.index(b)
+            self._clear_search()
+
+        elif b in self.mode_btns.values():
+            for mode, ob in self.mode_btns.items():
+                ob.active = ob is b
+                if ob is b:
+                    self.edit_mode = mode
+
+        elif b is self.btn_run:
+            if not self._searching():
+                # Cells dragged over earlier in this batch belong to the grid
+                # the search sees, not to an edit applied after it started
+                if self._paint_buffer:
+                    self._flush_paint()
+                self._start_search()
+
+        elif b is self.btn_pause:
+            self._toggle_pause()
+
+        elif b is self.btn_clear:
+            if not self._searching():
+                self._clear_search()
+
+        elif b is self.btn_reset:
+            if not self._searching():
+                self._init_grid()
+                self._clear_search()
 
     # ── Grid helpers ────────────────────────────────────────────────────────
-    def _is_valid(self, r, c):
-        return (0 <= r < GRID_ROWS and 0 <= c < GRID_COLS
-                and self.grid[r][c] != 1)
-
-    def _neighbors(self, node):
-        result = []
-        for dr, dc in DIRECTIONS:
-            nr, nc = node.row + dr, node.col + dc
-            if self._is_valid(nr, nc):
-                cost = math.sqrt(2) if abs(dr) + abs(dc) == 2 else 1.0
-                result.append(Node(nr, nc, node.cost + cost, node))
-        return result
-
-    def _trace_path(self, node):
-        path = []
-        while node:
-            path.append((node.row, node.col))
-            node = node.parent
-        return path[::-1]
+    def _snapshot_walls(self):
+        """Wall flags for the kernels, taken before a search starts."""
+        self._walls = (self.grid == 1).ravel().view(np.uint8)
 
     def _clear_search(self):
-        self.frontier = set()
-        self.explored = set()
+        self.frontier_mask = np.zeros(N_CELLS, dtype=np.uint8)
+        self.explored_mask = np.zeros(N_CELLS, dtype=np.uint8)
+        self.path_mask     = np.zeros(N_CELLS, dtype=np.uint8)
         self.path     = []
+        self._dirty[:] = True
         self.stats    = dict(nodes_explored=0, frontier_size=0,
                              path_length=0, elapsed=0.0, status="Ready")
 
-    def _step(self):
-        """Draw one frame and wait step_delay ms. Returns False if app quit."""
-        for ev in pygame.event.get():
-            if ev.type == pygame.QUIT:
-                pygame.quit(); sys.exit()
-            # Allow pause toggle while running
-            if self.btn_pause.handle(ev):
-                self.paused = not self.paused
-                self.btn_pause.text = "Resume" if self.paused else "Pause"
-        self._draw()
-        pygame.time.wait(self.step_delay)
-        while self.paused and self.running:
-            for ev in pygame.event.get():
-                if ev.type == pygame.QUIT:
-                    pygame.quit(); sys.exit()
-                if self.btn_pause.handle(ev):
-                    self.paused = not self.paused
-                    self.btn_pause.text = "Resume" if self.paused else "Pause"
-            self._draw()
-            self.clock.tick(30)
+    def _toggle_pause(self):
+        if self._resume.is_set():
+            self._resume.clear()
+            self.btn_pause.text = "Resume"
+        else:
+            self._resume.set()
+            self.btn_pause.text = "Pause"
+
+    def _step(self, nodes_explored, frontier_size):
+        """Called by the search thread after every expansion: publish the
+        live counts, block while paused, then sleep only what is left of
+        this step's step_delay budget. Events and drawing stay on the main
+        thread, which draws whatever has changed once per frame."""
+        self._step_counter += 1
+        self.stats.update(nodes_explored=nodes_explored, frontier_size=frontier_size)
+        if not self._resume.is_set():
+            self._resume.wait()
+            # Resume pacing from now rather than catching up the paused time
+            self._replay_t0 = (pygame.time.get_ticks()
+                               - self._step_counter * self.step_delay)
+
+        due = self._replay_t0 + self._step_counter * self.step_delay
+        delay = due - pygame.time.get_ticks()
+        if delay > 0:
+            pygame.time.wait(delay)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Algorithms
     # ─────────────────────────────────────────────────────────────────────────
-    def _bfs(self):
-        t0 = time.time()
-        self.stats['status'] = "Running BFS…"
-        queue   = deque([Node(*self.start)])
-        visited = {self.start}
-
-        while queue and self.running:
-            cur = queue.popleft()
-            pos = (cur.row, cur.col)
-            self.explored.add(pos)
-            self.frontier.discard(pos)
-            self.stats['nodes_explored'] += 1
-
-            if pos == self.target:
-                self.path = self._trace_path(cur)
-                self.stats.update(path_length=len(self.path),
-                                  elapsed=time.time()-t0, status="✓ Path Found!")
-                return
-
-            for nb in self._neighbors(cur):
-                nbp = (nb.row, nb.col)
-                if nbp not in visited:
-                    visited.add(nbp)
-                    queue.append(nb)
-                    self.frontier.add(nbp)
-
-            self.stats['frontier_size'] = len(queue)
-            self._step()
-
-        if self.running:
-            self.stats.update(elapsed=time.time()-t0, status="✗ No path found")
-
-    def _dfs(self):
-        t0 = time.time()
-        self.stats['status'] = "Running DFS…"
-        stack   = [Node(*self.start)]
-        visited = {self.start}
-
-        while stack and self.running:
-            cur = stack.pop()
-            pos = (cur.row, cur.col)
-            self.explored.add(pos)
-            self.frontier.discard(pos)
-            self.stats['nodes_explored'] += 1
-
-            if pos == self.target:
-                self.path = self._trace_path(cur)
-                self.stats.update(path_length=len(self.path),
-                                  elapsed=time.time()-t0, status="✓ Path Found!")
-                return
-
-            for nb in reversed(self._neighbors(cur)):
-                nbp = (nb.row, nb.col)
-                if nbp not in visited:
-                    visited.add(nbp)
-                    stack.append(nb)
-                    self.frontier.add(nbp)
-
-            self.stats['frontier_size'] = len(stack)
-            self._step()
-
-        if self.running:
-            self.stats.update(elapsed=time.time()-t0, status="✗ No path found")
-
-    def _ucs(self):
-        t0 = time.time()
-        self.stats['status'] = "Running UCS…"
-        heap    = [Node(*self.start, cost=0)]
-        visited = {}
-
-        while heap and self.running:
-            cur = heapq.heappop(heap)
-            pos = (cur.row, cur.col)
-
-            if pos in self.explored:
-                continue
-            self.explored.add(pos)
-            self.frontier.discard(pos)
-            self.stats['nodes_explored'] += 1
-
-            if pos == self.target:
-                self.path = self._trace_path(cur)
-                self.stats.update(path_length=len(self.path),
-                                  elapsed=time.time()-t0, status="✓ Path Found!")
-                return
-
-            for nb in self._neighbors(cur):
-                nbp = (nb.row, nb.col)
-                if nbp not in self.explored:
-                    if nbp not in visited or nb.cost < visited[nbp]:
-                        visited[nbp] = nb.cost
-                        heapq.heappush(heap, nb)
-                        self.frontier.add(nbp)
-
-            self.stats['frontier_size'] = len(heap)
-            self._step()
-
-        if self.running:
-            self.stats.update(elapsed=time.time()-t0, status="✗ No path found")
-
-    def _dls(self, limit=DLS_DEPTH_LIMIT):
-        """Iterative (stack-based) Depth-Limited Search. Returns found node or None."""
-        self.stats['status'] = f"Running DLS (limit={limit})…"
-        # Stack holds (node, depth)
-        stack   = [(Node(*self.start), 0)]
-        visited = {self.start}
-
-        while stack and self.running:
-            cur, depth = stack.pop()
-            pos = (cur.row, cur.col)
-            self.explored.add(pos)
-            self.frontier.discard(pos)
-            self.stats['nodes_explored'] += 1
-
-            if pos == self.target:
-                return cur
-
-            if depth < limit:
-                for nb in reversed(self._neighbors(cur)):
-                    nbp = (nb.row, nb.col)
-                    if nbp not in visited:
-                        visited.add(nbp)
-                        stack.append((nb, depth + 1))
-                        self.frontier.add(nbp)
-
-            self.stats['frontier_size'] = len(stack)
-            self._step()
-
-        return None
-
-    def _run_dls(self):
-        t0 = time.time()
-        result = self._dls()
-        if result:
-            self.path = self._trace_path(result)
-            self.stats.update(path_length=len(self.path),
-                              elapsed=time.time()-t0, status="✓ Path Found!")
-        elif self.running:
-            self.stats.update(elapsed=time.time()-t0,
-                              status=f"✗ No path within depth {DLS_DEPTH_LIMIT}")
-
-    def _iddfs(self):
-        t0 = time.time()
-        for limit in range(1, GRID_ROWS * GRID_COLS):
+    # Each solver runs its kernel, leaving the expansion trace in self._trace,
+    # and returns (n_events, path as flat cell indices, final status).
+    def _result(self, n, found, parent, status_ok, status_fail="✗ No path found"):
+        if found < 0:
+            return n, _NO_PATH, status_fail
+        return n, kernels.walk_parents(parent, found), status_ok
+
+    def _bfs(self, start, target):
+        parent = np.full(N_CELLS, -1, dtype=np.int32)
+        n, found = kernels.bfs(_NBR, self._walls, start, target, parent, self._trace)
+        return self._result(n, found, parent, "✓ Path Found!")
+
+    def _dfs(self, start, target):
+        parent = np.full(N_CELLS, -1, dtype=np.int32)
+        n, found = kernels.dfs(_NBR, self._walls, start, target, parent, self._trace)
+        return self._result(n, found, parent, "✓ Path Found!")
+
+    def _ucs(self, start, target):
+        parent = np.full(N_CELLS, -1, dtype=np.int32)
+        n, found = kernels.ucs(_NBR, self._walls, _COST_ARR, start, target,
+                               parent, self._trace)
+        return self._result(n, found, parent, "✓ Path Found!")
+
+    def _dls(self, start, target):
+        parent = np.full(N_CELLS, -1, dtype=np.int32)
+        n, found, _ = kernels.dls(_NBR, self._walls, start, target,
+                                  DLS_DEPTH_LIMIT, parent, self._trace, 0)
+        return self._result(n, found, parent, "✓ Path Found!",
+                            f"✗ No path within depth {DLS_DEPTH_LIMIT}")
+
+    def _iddfs(self, start, target):
+        parent = np.full(N_CELLS, -1, dtype=np.int32)
+        n, found = kernels.iddfs(_NBR, self._walls, start, target, parent, self._trace)
+        events = self._trace[:n]
+        limit = events[events[:, 0] == kernels.EV_DEPTH, 1][-1]
+        return self._result(n, found, parent, f"✓ Found at depth {limit}!")
+
+    def _bidirectional(self, start, target):
+        fwd_parent = np.full(N_CELLS, -1, dtype=np.int32)
+        bwd_parent = np.full(N_CELLS, -1, dtype=np.int32)
+        n, meet = kernels.bidirectional(_NBR, self._walls, start, target,
+                                        fwd_parent, bwd_parent, self._trace)
+        if meet < 0:
+            return n, _NO_PATH, "✗ No path found"
+        # Stitch path
+        fwd_path = kernels.walk_parents(fwd_parent, meet)
+        bwd_path = kernels.walk_parents(bwd_parent, meet)
+        return n, np.concatenate((fwd_path, bwd_path[-2::-1])), "✓ Paths Met!"
+
+    def _replay(self, n_events):
+        """Animate a finished search by replaying its trace, one expansion
+        per _step() like the original step-by-step loops."""
+        frontier, explored = self.frontier_mask, self.explored_mask
+        dirty = self._dirty
+        n_explored = n_frontier = 0
+        pending = False    # an expansion has been applied but not drawn yet
+        self._step_counter = 0
+        self._replay_t0 = pygame.time.get_ticks()
+
+        for kind, idx in self._trace[:n_events].tolist():
             if not self.running:
                 return
-            self._clear_search()
-            self.stats['status'] = f"IDDFS – trying depth {limit}…"
-            result = self._dls(limit)
-            if result:
-                self.path = self._trace_path(result)
-                self.stats.update(path_length=len(self.path),
-                                  elapsed=time.time()-t0,
-                                  status=f"✓ Found at depth {limit}!")
-                return
-        if self.running:
-            self.stats.update(elapsed=time.time()-t0, status="✗ No path found")
-
-    def _bidirectional(self):
-        t0 = time.time()
-        self.stats['status'] = "Running Bidirectional…"
-
-        fwd_queue   = deque([Node(*self.start)])
-        bwd_queue   = deque([Node(*self.target)])
-        fwd_visited = {self.start:  Node(*self.start)}
-        bwd_visited = {self.target: Node(*self.target)}
-
-        while (fwd_queue or bwd_queue) and self.running:
-            # ── Forward step ──
-            if fwd_queue:
-                cur = fwd_queue.popleft()
-                pos = (cur.row, cur.col)
-                self.explored.add(pos)
-                self.frontier.discard(pos)
-                self.stats['nodes_explored'] += 1
-
-                if pos in bwd_visited:
-                    # Stitch path
-                    fwd_path = self._trace_path(cur)
-                    bwd_path = self._trace_path(bwd_visited[pos])
-                    self.path = fwd_path + bwd_path[-2::-1]
-                    self.stats.update(path_length=len(self.path),
-                                      elapsed=time.time()-t0, status="✓ Paths Met!")
-                    return
-
-                for nb in self._neighbors(cur):
-                    nbp = (nb.row, nb.col)
-                    if nbp not in fwd_visited:
-                        fwd_visited[nbp] = nb
-                        fwd_queue.append(nb)
-                        self.frontier.add(nbp)
-
-            # ── Backward step ──
-            if bwd_queue:
-                cur = bwd_queue.popleft()
-                pos = (cur.row, cur.col)
-                self.explored.add(pos)
-                self.frontier.discard(pos)
-                self.stats['nodes_explored'] += 1
-
-                if pos in fwd_visited:
-                    fwd_path = self._trace_path(fwd_visited[pos])
-                    bwd_path = self._trace_path(cur)
-                    self.path = fwd_path + bwd_path[-2::-1]
-                    self.stats.update(path_length=len(self.path),
-                                      elapsed=time.time()-t0, status="✓ Paths Met!")
-                    return
-
-                for nb in self._neighbors(cur):
-                    nbp = (nb.row, nb.col)
-                    if nbp not in bwd_visited:
-                        bwd_visited[nbp] = nb
-                        bwd_queue.append(nb)
-                        self.frontier.add(nbp)
-
-            self.stats['frontier_size'] = len(fwd_queue) + len(bwd_queue)
-            self._step()
-
-        if self.running:
-            self.stats.update(elapsed=time.time()-t0, status="✗ No path found")
+            if pending and kind != kernels.EV_FRONTIER:
+                self._step(n_explored, n_frontier)
+                pending = False
+
+            if kind == kernels.EV_EXPLORE:
+                dirty[idx] = True
+                if frontier[idx]:
+                    frontier[idx] = 0
+                    n_frontier -= 1
+                explored[idx] = 1
+                n_explored += 1
+                pending = True
+            elif kind == kernels.EV_FRONTIER:
+                if not frontier[idx]:
+                    dirty[idx] = True
+                    frontier[idx] = 1
+                    n_frontier += 1
+            else:   # EV_DEPTH: IDDFS starts over with a deeper limit
+                frontier.fill(0)
+                explored.fill(0)
+                dirty.fill(True)
+                n_explored = n_frontier = 0
+                self.stats['status'] = f"IDDFS – trying depth {idx}…"
+        self.stats.update(nodes_explored=n_explored, frontier_size=n_frontier)
+
+    def _warm_up(self):
+        """Run every solver once on the startup grid, so JIT compilation (or
+        loading it from numba's cache) is not counted in the first search."""
+        self._snapshot_walls()
+        for fn in (self._bfs, self._dfs, self._ucs, self._dls, self._iddfs,
+                   self._bidirectional):
+            fn(self.start, self.target)
+
+    def _start_search(self):
+        if self._search is None or self._search.done():
+            self._search = self._pool.submit(self._run_algorithm)
+            self._search.add_done_callback(self._search_done)
+
+    @staticmethod
+    def _search_done(future):
+        # The pool keeps exceptions in the future; report them like a thread would
+        exc = future.exception()
+        if exc is not None:
+            sys.excepthook(type(exc), exc, exc.__traceback__)
+        # Wake the main loop, which may be idling in event.wait, to draw the
+        # result (unless the app is already shutting down)
+        try:
+            pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+        except pygame.error:
+            pass   # pygame was shut down under us
+
+    def _searching(self):
+        return self._search is not None and not self._search.done()
+
+    def _stop_search(self):
+        """Let the worker finish quickly: the replay exits once running is
+        cleared, and a paused replay has to be woken up to notice."""
+        self.running = False
+        self._resume.set()
+        self._pool.shutdown(wait=False)
 
     def _run_algorithm(self):
         self._clear_search()
+        self._snapshot_walls()
         self.running = True
         name = ALGORITHMS[self.algo_idx]
         fn = {"BFS": self._bfs, "DFS": self._dfs, "UCS": self._ucs,
-              "DLS": self._run_dls, "IDDFS": self._iddfs,
+              "DLS": self._dls, "IDDFS": self._iddfs,
               "Bidirectional": self._bidirectional}[name]
-        fn()
+        self.stats['status'] = (f"Running DLS (limit={DLS_DEPTH_LIMIT})…"
+                                if name == "DLS" else f"Running {name}…")
+
+        t0 = time.perf_counter()
+        n_events, cells, status = fn(self.start, self.target)
+        elapsed = time.perf_counter() - t0
+
+        self._replay(n_events)
+        if self.running:
+            self.path = [divmod(idx, GRID_COLS) for idx in cells.tolist()]
+            self.path_mask[cells] = 1
+            self._dirty[cells] = True
+            self.stats.update(path_length=len(cells), elapsed=elapsed, status=status)
         self.running = False
 
     # ─────────────────────────────────────────────────────────────────────────
     # Drawing
     # ─────────────────────────────────────────────────────────────────────────
-    def _draw_grid(self):
-        for r in range(GRID_ROWS):
-            for c in range(GRID_COLS):
-                x = GRID_OFFSET_X + c * CELL_SIZE
-                y = GRID_OFFSET_Y + r * CELL_SIZE
-                pos = (r, c)
-
-                if pos == self.start:
-                    col = C_START
-                elif pos == self.target:
-                    col = C_TARGET
-                elif pos in self.path:
-                    col = C_PATH
-                elif pos in self.explored:
-                    col = C_EXPLORED
-                elif pos in self.frontier:
-                    col = C_FRONTIER
-                elif self.grid[r][c] == 1:
-                    col = C_WALL
-                else:
-                    col = C_EMPTY
-
-                pygame.draw.rect(self.screen, col,
-                                 (x+1, y+1, CELL_SIZE-2, CELL_SIZE-2))
-                pygame.draw.rect(self.screen, C_GRID,
-                                 (x, y, CELL_SIZE, CELL_SIZE), 1)
-
-                # Label S / T
-                if pos == self.start or pos == self.target:
-                    lbl = self.font_small.render(
-                        "S" if pos == self.start else "T", True, C_TEXT)
-                    self.screen.blit(lbl, lbl.get_rect(
-                        center=(x + CELL_SIZE//2, y + CELL_SIZE//2)))
-
-    def _draw_panel(self):
+    def _draw_grid(self, full):
+        """Rebuild the cached grid image when any cell is dirty: cell states
+        are resolved with whole-array NumPy ops, written as one pixel per
+        cell with blit_array and scaled up to CELL_SIZE in a single call.
+        Returns the screen rect touched, or None if nothing was drawn."""
+        rebuilt = self._dirty.any()
+        if rebuilt:
+            # Clear flags before reading cell state, so a cell the search
+            # thread touches meanwhile is either drawn now or stays flagged
+            self._dirty[:] = False
+            state = np.where(self.grid.ravel() == 1, R_WALL, R_EMPTY)
+            state[self.frontier_mask != 0] = R_FRONTIER
+            state[self.explored_mask != 0] = R_EXPLORED
+            state[self.path_mask != 0]     = R_PATH
+            state[self.start]  = R_START
+            state[self.target] = R_TARGET
+
+            # surfarray is indexed (x, y), so transpose the row-major grid
+            colors = PALETTE[state].reshape(GRID_ROWS, GRID_COLS, 3)
+            pygame.surfarray.blit_array(self._cell_surf, colors.transpose(1, 0, 2))
+            surf = self._grid_surf
+            pygame.transform.scale(self._cell_surf, surf.get_size(), surf)
+            surf.blit(self._gridlines, (0, 0))
+
+            # Label S / T
+            for idx, lbl in ((self.start, self._glyph_start),
+                             (self.target, self._glyph_target)):
+                r, c = divmod(idx, GRID_COLS)
+                surf.blit(lbl, lbl.get_rect(
+                    center=(c * CELL_SIZE + CELL_SIZE//2,
+                            r * CELL_SIZE + CELL_SIZE//2)))
+
+        if rebuilt or full:
+            return self.screen.blit(self._grid_surf, (GRID_OFFSET_X, GRID_OFFSET_Y))
+        return None
+
+    def _draw_panel(self, surf, static):
+        """Lay out the side panel. The fixed headers, labels and legend
+        (static=True) go into the cached background once; the values that
+        change (static=False) are drawn over it on every panel update."""
         px, py = PANEL_X, GRID_OFFSET_Y
 
         # Title
-        self.screen.blit(
-            self.font_info.render("Statistics", True, C_ACCENT), (px, py))
+        if static:
+            surf.blit(self._hdr_stats, (px, py))
         py += 32
 
-        algo_name = ALGORITHMS[self.algo_idx]
-        self.screen.blit(
-            self.font_info.render(f"Algorithm:  {algo_name}", True, C_TEXT), (px, py))
+        if static:
+            surf.blit(self._lbl_algo, (px, py))
+        else:
+            algo_name = ALGORITHMS[self.algo_idx]
+            surf.blit(self._text(self.font_info, algo_name, C_TEXT),
+                      (px + self._lbl_algo.get_width(), py))
         py += 26
 
-        status_col = (250, 180, 50) if "✗" in self.stats['status'] else \
-                     (100, 220, 120) if "✓" in self.stats['status'] else C_TEXT
-        self.screen.blit(
-            self.font_small.render(self.stats['status'], True, status_col), (px, py))
+        if not static:
+            status_col = (250, 180, 50) if "✗" in self.stats['status'] else \
+                         (100, 220, 120) if "✓" in self.stats['status'] else C_TEXT
+            surf.blit(
+                self._text(self.font_small, self.stats['status'], status_col), (px, py))
         py += 30
 
         # Stats rows
-        rows = [
-            ("Nodes Explored", self.stats['nodes_explored']),
-            ("Frontier Size",  self.stats['frontier_size']),
-            ("Path Length",    self.stats['path_length']),
-            ("Time",           f"{self.stats['elapsed']:.3f}s"),
+        values = [
+            self.stats['nodes_explored'],
+            self.stats['frontier_size'],
+            self.stats['path_length'],
+            # Kernel time alone runs to microseconds, so show it in ms
+            f"{self.stats['elapsed'] * 1e3:.3f} ms",
         ]
-        for label, val in rows:
-            self.screen.blit(
-                self.font_small.render(f"{label}:  {val}", True, C_SUBTEXT), (px, py))
+        for label_surf, val in zip(self._stat_label_surfs, values):
+            if static:
+                surf.blit(label_surf, (px, py))
+            else:
+                surf.blit(self.font_small.render(str(val), True, C_SUBTEXT),
+                          (px + label_surf.get_width(), py))
             py += 22
 
         # Legend
         py += 18
-        self.screen.blit(self.font_info.render("Legend", True, C_ACCENT), (px, py))
+        if static:
+            surf.blit(self._hdr_legend, (px, py))
         py += 26
-        legend = [("Start (S)",  C_START), ("Target (T)", C_TARGET),
-                  ("Wall",       C_WALL),  ("Frontier",   C_FRONTIER),
-                  ("Explored",   C_EXPLORED), ("Path",    C_PATH)]
-        for label, col in legend:
-            pygame.draw.rect(self.screen, col, (px, py, 18, 18), border_radius=3)
-            self.screen.blit(
-                self.font_small.render(label, True, C_TEXT), (px + 26, py + 2))
+        for label_surf, col in self._legend_surfs:
+            if static:
+                pygame.draw.rect(surf, col, (px, py, 18, 18), border_radius=3)
+                surf.blit(label_surf, (px + 26, py + 2))
             py += 26
 
         # Edit mode indicator
         py += 10
-        mode_label = self.edit_mode.replace("_", " ").title()
-        self.screen.blit(
-            self.font_small.render(f"Edit Mode:  {mode_label}", True, C_ACCENT),
-            (px, py))
-
-    def _draw(self):
-        self.screen.fill(C_BG)
-
-        # Title bar
+        if static:
+            surf.blit(self._lbl_mode, (px, py))
+        else:
+            mode_label = self.edit_mode.replace("_", " ").title()
+            surf.blit(self._text(self.font_small, mode_label, C_ACCENT),
+                      (px + self._lbl_mode.get_width(), py))
+
+    def _build_background(self):
+        """Everything that never changes - background, title and the panel's
+        fixed text - pre-rendered into one display-format surface."""
+        self._background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._background.fill(C_BG)
         title = self.font_title.render(
             "AI Pathfinder  –   ", True, C_TEXT)
-        self.screen.blit(title, (WINDOW_WIDTH//2 - title.get_width()//2, 6))
-
-        # Buttons
-        for b in self.algo_btns:
-            b.draw(self.screen)
-        for b in self.ctrl_btns:
-            b.draw(self.screen)
-        for b in self.mode_btns.values():
-            b.draw(self.screen)
+        self._background.blit(title, (WINDOW_WIDTH//2 - title.get_width()//2, 6))
+        self._draw_panel(self._background, static=True)
 
-        self._draw_grid()
-        self._draw_panel()
-        pygame.display.flip()
+    def _draw(self):
+        """Redraw only the parts of the window whose content changed since the
+        last frame and push just those rects to the display. _full_redraw
+        repaints everything (first frame, or after the window is exposed)."""
+        full, self._full_redraw = self._full_redraw, False
+        rects = []
+        if full:
+            self.screen.blit(self._background, (0, 0))
+            rects.append(self.screen.get_rect())
+
+        # Buttons: only those whose look changed, in one batched blit
+        faces = []
+        for b in self._buttons:
+            look = b.look
+            if full or self._btn_drawn.get(b) != look:
+                self._btn_drawn[b] = look
+                faces.append((b.face(self._background), b.rect))
+                rects.append(b.rect)
+        if faces:
+            self.screen.blits(faces, doreturn=False)
+
+        grid_rect = self._draw_grid(full)
+        if grid_rect:
+            rects.append(grid_rect)
+
+        # Snapshot what the panel shows before drawing it, so an update from
+        # the search thread mid-draw still differs next frame
+        panel = (self.algo_idx, self.edit_mode, *self.stats.values())
+        if full or panel != self._panel_drawn:
+            self._panel_drawn = panel
+            self.screen.blit(self._background, PANEL_RECT, PANEL_RECT)
+            self._draw_panel(self.screen, static=False)
+            rects.append(PANEL_RECT)
+
+        if rects:
+            pygame.display.update(rects)
 
     # ─────────────────────────────────────────────────────────────────────────
     # Grid interaction
     # ─────────────────────────────────────────────────────────────────────────
-    def _grid_click(self, mouse_pos):
+    @staticmethod
+    def _cell_at(mouse_pos):
+        """Flat index of the cell under the mouse, or -1 outside the grid."""
         x, y = mouse_pos
         c = (x - GRID_OFFSET_X) // CELL_SIZE
         r = (y - GRID_OFFSET_Y) // CELL_SIZE
-        if not (0 <= r < GRID_ROWS and 0 <= c < GRID_COLS):
+        if 0 <= r < GRID_ROWS and 0 <= c < GRID_COLS:
+            return r * GRID_COLS + c
+        return -1
+
+    def _grid_click(self, mouse_pos):
+        idx = self._cell_at(mouse_pos)
+        if idx < 0:
             return
+        # Clicked cell plus the current start/target, which may move away
+        self._dirty[[idx, self.start, self.target]] = True
 
+        # The grid itself marks start (2) and target (3), so no position
+        # comparisons are needed; neither endpoint may land on the other
+        flat = self.grid.reshape(-1)
+        cell = flat[idx]
         if self.edit_mode == 'place_start':
-            self.grid[self.start[0]][self.start[1]] = 0
-            self.start = (r, c)
-            self.grid[r][c] = 2
+            if cell != 3:
+                flat[self.start] = 0
+                self.start = idx
+                flat[idx] = 2
 
         elif self.edit_mode == 'place_target':
-            self.grid[self.target[0]][self.target[1]] = 0
-            self.target = (r, c)
-            self.grid[r][c] = 3
+            if cell != 2:
+                flat[self.target] = 0
+                self.target = idx
+                flat[idx] = 3
 
         elif self.edit_mode == 'place_wall':
-            if (r, c) not in (self.start, self.target):
-                self.grid[r][c] = 0 if self.grid[r][c] == 1 else 1
+            if cell < 2:
+                flat[idx] = cell ^ 1
+                # Dragging on from here paints what this click made the cell
+                self._paint_value = cell ^ 1
 
         elif self.edit_mode == 'erase':
-            if (r, c) not in (self.start, self.target):
-                self.grid[r][c] = 0
+            if cell == 1:
+                flat[idx] = 0
+
+    def _paint(self, mouse_pos):
+        """Queue the cell under a drag; _flush_paint applies the batch."""
+        idx = self._cell_at(mouse_pos)
+        if idx >= 0 and (not self._paint_buffer or self._paint_buffer[-1] != idx):
+            self._paint_buffer.append(idx)
+
+    def _flush_paint(self):
+        """Apply every cell dragged over since the last frame with one store.
+        Start and target (grid values 2 and 3) are left alone."""
+        cells = np.array(self._paint_buffer, dtype=np.intp)
+        self._paint_buffer.clear()
+        flat = self.grid.reshape(-1)
+        cells = cells[flat[cells] < 2]
+        flat[cells] = self._paint_value
+        self._dirty[cells] = True
 
     # ─────────────────────────────────────────────────────────────────────────
     # Main loop
     # ─────────────────────────────────────────────────────────────────────────
+    @staticmethod
+    def _wait_event(timeout=0):
+        """Block until an event arrives (or timeout ms pass, if non-zero).
+        Returns it in a list, empty on timeout. The event is handed back
+        rather than re-posted, which would queue it behind later ones."""
+        event = pygame.event.wait(timeout)
+        return [] if event.type == pygame.NOEVENT else [event]
+
     def run(self):
-        import threading
+        try:
+            self._main_loop()
+        finally:
+            # However the loop ends (exception, Ctrl+C): the pool's worker is
+            # not a daemon, so stop the search rather than wait out its replay
+            self._stop_search()
+
+    def _main_loop(self):
         dragging = False
+        waited = []   # event that ended a wait; handled first
 
         while True:
-            for event in pygame.event.get():
+            for event in waited + pygame.event.get():
                 if event.type == pygame.QUIT:
+                    self._stop_search()
                     pygame.quit(); sys.exit()
-
-                # ── Algorithm selection ──
-                for i, b in enumerate(self.algo_btns):
-                    if b.handle(event):
-                        for ob in self.algo_btns: ob.active = False
-                        b.active = True
-                        self.algo_idx = i
-                        self._clear_search()
-
-                # ── Mode selection ──
-                for mode, b in self.mode_btns.items():
-                    if b.handle(event):
-                        for ob in self.mode_btns.values(): ob.active = False
-                        b.active = True
-                        self.edit_mode = mode
-
-                # ── Control buttons ──
-                if self.btn_run.handle(event) and not self.running:
-                    t = threading.Thread(target=self._run_algorithm, daemon=True)
-                    t.start()
-
-                if self.btn_pause.handle(event):
-                    self.paused = not self.paused
-                    self.btn_pause.text = "Resume" if self.paused else "Pause"
-
-                if self.btn_clear.handle(event) and not self.running:
-                    self._clear_search()
-
-                if self.btn_reset.handle(event) and not self.running:
-                    self._init_grid()
-                    self._clear_search()
+                if event.type == pygame.VIDEOEXPOSE:
+                    self._full_redraw = True
+                elif event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWHIDDEN):
+                    self._visible = False
+                elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWSHOWN):
+                    self._visible = True
+                    self._full_redraw = True
+
+                # ── Buttons: one hit test per mouse event ──
+                if event.type == pygame.MOUSEMOTION:
+                    self._hover(self._button_at(event.pos))
+                elif event.type == pygame.MOUSEBUTTONDOWN:
+                    b = self._button_at(event.pos)
+                    if b is not None:
+                        self._press(b)
 
                 # ── Grid drawing (click + drag for walls) ──
-                if event.type == pygame.MOUSEBUTTONDOWN and not self.running:
+                if event.type == pygame.MOUSEBUTTONDOWN and not self._searching():
                     dragging = True
+                    self._paint_value = 0 if self.edit_mode == 'erase' else 1
                     self._grid_click(event.pos)
                 if event.type == pygame.MOUSEBUTTONUP:
                     dragging = False
-                if event.type == pygame.MOUSEMOTION and dragging and not self.running:
+                if event.type == pygame.MOUSEMOTION and dragging and not self._searching():
                     if self.edit_mode in ('place_wall', 'erase'):
-                        self._grid_click(event.pos)
-
-            self._draw()
-            self.clock.tick(60)
+                        self._paint(event.pos)
+
+            if self._paint_buffer:
+                self._flush_paint()
+
+            if self._visible:
+                self._draw()
+                self.clock.tick(FPS)
+                # Idle: the screen is current and only an event can change
+                # it, so sleep until one arrives instead of polling at FPS
+                waited = [] if self._searching() else self._wait_event(IDLE_WAIT_MS)
+            else:
+                # Nothing can be seen, so sleep until the next event instead of
+                # ticking; the search thread keeps running meanwhile
+                waited = self._wait_event()
 
 
 if __name__ == "__main__":